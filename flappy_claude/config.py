@@ -26,6 +26,7 @@ class Config:
 
     # Timing
     death_display_time: float = 1.0
+    signal_poll_frames: int = 15  # Check the signal file every N frames (~0.5s)
 
     # Files
     high_score_path: str = "~/.flappy-claude/highscore"
@@ -1,5 +1,6 @@
 """Game entities: Bird, Pipe, GameState."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
@@ -42,7 +43,7 @@ class Bird:
         self.y += self.velocity
 
 
-@dataclass
+@dataclass(slots=True)
 class Pipe:
     """An obstacle the bird must navigate through."""
 
@@ -50,6 +51,14 @@ class Pipe:
     gap_y: int
     gap_size: int
     passed: bool = False
+    # Rows bounding the gap (inclusive), fixed for the pipe's lifetime
+    gap_top: int = field(init=False, repr=False, compare=False)
+    gap_bottom: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the gap rows once instead of on every render."""
+        self.gap_top = int(self.gap_y - self.gap_size / 2)
+        self.gap_bottom = int(self.gap_y + self.gap_size / 2)
 
     def update(self, config: Config) -> None:
         """Move pipe leftward."""
@@ -65,7 +74,8 @@ class GameState:
     """Overall game state container."""
 
     bird: Bird
-    pipes: list[Pipe] = field(default_factory=list)
+    pipes: deque[Pipe] = field(default_factory=deque)  # Ordered left to right
+    next_pipe: int = 0  # Index of the first pipe the bird hasn't passed yet
     score: int = 0
     high_score: int = 0
     status: GameStatus = GameStatus.WAITING
@@ -88,7 +98,8 @@ class GameState:
     def reset(self, config: Config) -> None:
         """Reset game state for a new round (keeps high score and mode)."""
         self.bird = Bird(y=config.screen_height // 2, x=config.screen_width // 4)
-        self.pipes = []
+        self.pipes.clear()
+        self.next_pipe = 0
         self.score = 0
         self.status = GameStatus.PLAYING
         self.claude_ready = False
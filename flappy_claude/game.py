@@ -1,33 +1,61 @@
 """Core game loop and rendering with curses."""
 
 import curses
+import functools
+import itertools
+import os
 import random
+import selectors
 import time
+from collections.abc import Sequence
 from pathlib import Path
 
 from flappy_claude.config import Config
 from flappy_claude.entities import Bird, GameMode, GameState, GameStatus, Pipe
-from flappy_claude.ipc import check_signal_file, delete_signal_file
-from flappy_claude.physics import apply_gravity, check_collision, check_pipe_passed
+from flappy_claude.ipc import (
+    check_signal_file,
+    delete_signal_file,
+    signal_file_changed,
+    watch_signal_file,
+)
+from flappy_claude.physics import check_collision, check_pipe_passed
 from flappy_claude.scores import save_high_score
 
+_QUIT_KEYS = (ord('q'), ord('Q'), 27)  # q, Q, or ESC
+_ANSWER_KEYS = (ord('y'), ord('Y'), ord('n'), ord('N'))  # Claude ready prompt answers
+_MAX_CATCHUP_TICKS = 4  # Most simulation ticks to run in one frame after a slow render
 
-def render_game(stdscr, state: GameState, config: Config) -> None:
+# Bound once: randrange skips randint's extra call layer
+_randrange = random.Random().randrange
+
+# Pipes are drawn as a single byte in the render grid and mapped to "█" on output
+_PIPE_BYTE = b"\xdb"
+_GRID_GLYPHS = str.maketrans({"\xdb": "█"})
+
+_FOOTER = " SPACE=flap  Q=quit "
+_FOOTER_CLAUDE_WAITING = " SPACE=flap  Y=return to Claude  Q=quit "
+
+
+def render_game(stdscr: curses.window, state: GameState, config: Config, attrs: dict[str, int]) -> None:
     """Render the game state using curses.
 
+    Like the other render functions this only stages the frame; the caller
+    writes it to the terminal with curses.doupdate().
+
     Args:
         stdscr: curses window
         state: Current game state
         config: Game configuration
+        attrs: Text attributes built by init_colors()
     """
-    stdscr.clear()
+    stdscr.erase()
     max_y, max_x = stdscr.getmaxyx()
 
     # Draw border
     try:
-        stdscr.attron(curses.color_pair(1))
+        stdscr.attron(attrs["border"])
         stdscr.border()
-        stdscr.attroff(curses.color_pair(1))
+        stdscr.attroff(attrs["border"])
     except curses.error:
         pass
 
@@ -35,54 +63,64 @@ def render_game(stdscr, state: GameState, config: Config) -> None:
     if state.claude_ready and state.status == GameStatus.PLAYING:
         # Claude finished but user chose to keep playing - show blinking indicator
         header = f" Score: {state.score}  |  High: {state.high_score}  |  CLAUDE WAITING "
-        header_color = curses.color_pair(3) | curses.A_BOLD | curses.A_BLINK
+        header_color = attrs["header_waiting"]
     else:
         header = f" Score: {state.score}  |  High: {state.high_score}  |  Flappy Claude "
-        header_color = curses.color_pair(2) | curses.A_BOLD
+        header_color = attrs["header"]
     try:
         stdscr.addstr(0, max(0, (max_x - len(header)) // 2), header, header_color)
     except curses.error:
         pass
 
-    # Draw game area
-    bird_row = int(state.bird.y)
-    for row in range(config.screen_height):
-        for col in range(config.screen_width):
-            screen_row = row + 2  # Offset for header
-            screen_col = col + 2  # Offset for border
-
-            if screen_row >= max_y - 1 or screen_col >= max_x - 2:
-                continue
-
-            # Skip the column after the crab (emoji is 2 chars wide)
-            if col == state.bird.x + 1 and row == bird_row:
-                continue
-
-            char = _get_char_at(state, config, col, row)
+    # Draw game area (one addstr per row, crab drawn on top)
+    visible_rows = min(config.screen_height, max_y - 3)
+    visible_cols = min(config.screen_width, max_x - 4)
+    if visible_cols > 0:
+        pipe_attr = attrs["pipe"]
+        for row, line in enumerate(_rasterize(state, config)[:visible_rows]):
             try:
-                if char == "🦀":  # Crab
-                    stdscr.addstr(screen_row, screen_col, char, curses.color_pair(3) | curses.A_BOLD)
-                elif char == "█":  # Pipe
-                    stdscr.addstr(screen_row, screen_col, char, curses.color_pair(4))
-                else:
-                    stdscr.addstr(screen_row, screen_col, char)
+                stdscr.addstr(row + 2, 2, line[:visible_cols], pipe_attr)
             except curses.error:
                 pass
 
+    bird_row = int(state.bird.y)
+    bird_col = state.bird.x
+    if 0 <= bird_row < visible_rows and 0 <= bird_col < visible_cols:
+        try:
+            stdscr.addstr(bird_row + 2, bird_col + 2, "🦀", attrs["bird"])
+        except curses.error:
+            pass
+
     # Draw footer
     if state.claude_ready and state.status == GameStatus.PLAYING:
-        footer = " SPACE=flap  Y=return to Claude  Q=quit "
+        footer = _FOOTER_CLAUDE_WAITING
     else:
-        footer = " SPACE=flap  Q=quit "
+        footer = _FOOTER
     try:
-        stdscr.addstr(max_y - 1, max(0, (max_x - len(footer)) // 2), footer, curses.color_pair(5))
+        stdscr.addstr(max_y - 1, max(0, (max_x - len(footer)) // 2), footer, attrs["footer"])
     except curses.error:
         pass
 
-    stdscr.refresh()
+    stdscr.noutrefresh()
+
+
+@functools.lru_cache(maxsize=4)
+def _overlay_box(box_width: int) -> tuple[str, str, str]:
+    """Return the (top, middle, bottom) border lines for an overlay box."""
+    return (
+        "╔" + "═" * (box_width - 2) + "╗",
+        "║" + " " * (box_width - 2) + "║",
+        "╚" + "═" * (box_width - 2) + "╝",
+    )
 
 
-def render_overlay(stdscr, title: str, lines: list[str], config: Config) -> None:
+def render_overlay(
+    stdscr: curses.window,
+    title: str,
+    lines: Sequence[str],
+    config: Config,
+    attrs: dict[str, int],
+) -> None:
     """Render a centered overlay box.
 
     Args:
@@ -90,6 +128,7 @@ def render_overlay(stdscr, title: str, lines: list[str], config: Config) -> None
         title: Overlay title
         lines: Lines of text to display
         config: Game configuration
+        attrs: Text attributes built by init_colors()
     """
     max_y, max_x = stdscr.getmaxyx()
 
@@ -100,6 +139,7 @@ def render_overlay(stdscr, title: str, lines: list[str], config: Config) -> None
     start_x = (max_x - box_width) // 2
 
     # Draw box
+    top, middle, bottom = _overlay_box(box_width)
     try:
         for i in range(box_height):
             y = start_y + i
@@ -107,64 +147,74 @@ def render_overlay(stdscr, title: str, lines: list[str], config: Config) -> None
                 continue
 
             if i == 0:
-                line = "╔" + "═" * (box_width - 2) + "╗"
+                line = top
             elif i == box_height - 1:
-                line = "╚" + "═" * (box_width - 2) + "╝"
+                line = bottom
             else:
-                line = "║" + " " * (box_width - 2) + "║"
+                line = middle
 
-            stdscr.addstr(y, start_x, line, curses.color_pair(6) | curses.A_BOLD)
+            stdscr.addstr(y, start_x, line, attrs["overlay"])
 
         # Draw title
         title_x = start_x + (box_width - len(title)) // 2
-        stdscr.addstr(start_y, title_x, title, curses.color_pair(6) | curses.A_BOLD)
+        stdscr.addstr(start_y, title_x, title, attrs["overlay"])
 
         # Draw content lines
         for i, line in enumerate(lines):
             y = start_y + 2 + i
             x = start_x + (box_width - len(line)) // 2
             if y < max_y and x < max_x:
-                stdscr.addstr(y, x, line, curses.color_pair(2))
+                stdscr.addstr(y, x, line, attrs["overlay_text"])
 
     except curses.error:
         pass
 
-    stdscr.refresh()
+    stdscr.noutrefresh()
 
 
-def render_claude_ready_prompt(stdscr, state: GameState, config: Config, countdown: int) -> None:
-    """Render the Claude ready prompt overlay with countdown."""
-    render_game(stdscr, state, config)
-
-    if state.was_playing:
+@functools.lru_cache(maxsize=1)
+def _claude_ready_lines(was_playing: bool, score: int, countdown: int) -> tuple[str, ...]:
+    """Build the Claude ready prompt text (cached until score or countdown changes)."""
+    if was_playing:
         # User was actively playing
-        lines = [
+        return (
             "Claude has finished!",
             "",
-            f"Your Score: {state.score}",
+            f"Your Score: {score}",
             "",
             "[Y] Return to Claude",
             "[N] Keep playing",
             "",
             f"Auto-closing in {countdown}s...",
-        ]
-    else:
-        # User was on waiting screen
-        lines = [
-            "Claude has finished!",
-            "",
-            "[Y] Return to Claude",
-            "[N] Start playing anyway",
-            "",
-            f"Auto-closing in {countdown}s...",
-        ]
+        )
+
+    # User was on waiting screen
+    return (
+        "Claude has finished!",
+        "",
+        "[Y] Return to Claude",
+        "[N] Start playing anyway",
+        "",
+        f"Auto-closing in {countdown}s...",
+    )
+
 
-    render_overlay(stdscr, " Claude Ready! ", lines, config)
+def render_claude_ready_prompt(
+    stdscr: curses.window,
+    state: GameState,
+    config: Config,
+    attrs: dict[str, int],
+    countdown: int,
+) -> None:
+    """Render the Claude ready prompt overlay with countdown."""
+    render_game(stdscr, state, config, attrs)
+    lines = _claude_ready_lines(state.was_playing, state.score, countdown)
+    render_overlay(stdscr, " Claude Ready! ", lines, config, attrs)
 
 
-def render_death_screen(stdscr, state: GameState, config: Config) -> None:
+def render_death_screen(stdscr: curses.window, state: GameState, config: Config, attrs: dict[str, int]) -> None:
     """Render the death screen for auto-restart mode."""
-    render_game(stdscr, state, config)
+    render_game(stdscr, state, config, attrs)
     render_overlay(
         stdscr,
         " Game Over ",
@@ -175,12 +225,13 @@ def render_death_screen(stdscr, state: GameState, config: Config) -> None:
             "Restarting...",
         ],
         config,
+        attrs,
     )
 
 
-def render_game_over_screen(stdscr, state: GameState, config: Config) -> None:
+def render_game_over_screen(stdscr: curses.window, state: GameState, config: Config, attrs: dict[str, int]) -> None:
     """Render the game over screen for single-life mode."""
-    render_game(stdscr, state, config)
+    render_game(stdscr, state, config, attrs)
     render_overlay(
         stdscr,
         " Game Over ",
@@ -191,12 +242,13 @@ def render_game_over_screen(stdscr, state: GameState, config: Config) -> None:
             "Press any key to exit",
         ],
         config,
+        attrs,
     )
 
 
-def render_waiting_screen(stdscr, state: GameState, config: Config) -> None:
+def render_waiting_screen(stdscr: curses.window, state: GameState, config: Config, attrs: dict[str, int]) -> None:
     """Render the waiting screen before game starts."""
-    render_game(stdscr, state, config)
+    render_game(stdscr, state, config, attrs)
     render_overlay(
         stdscr,
         " Flappy Claude ",
@@ -208,38 +260,45 @@ def render_waiting_screen(stdscr, state: GameState, config: Config) -> None:
             "Press SPACE to start",
         ],
         config,
+        attrs,
     )
 
 
-def _get_char_at(state: GameState, config: Config, col: int, row: int) -> str:
-    """Get the character to display at a specific position."""
-    # Check if bird is at this position
-    bird_row = int(state.bird.y)
-    if col == state.bird.x and row == bird_row:
-        return "🦀"
-
-    # Check if any pipe is at this position
-    for pipe in state.pipes:
-        if _is_pipe_at(pipe, config, col, row):
-            return "█"
+@functools.lru_cache(maxsize=8)
+def _pipe_span(width: int) -> bytes:
+    """Return the grid bytes for a pipe (or its clipped edge) of this width."""
+    return _PIPE_BYTE * width
 
-    return " "
 
+def _rasterize(state: GameState, config: Config) -> list[str]:
+    """Draw the pipes into a character grid and return it as one string per row.
 
-def _is_pipe_at(pipe: Pipe, config: Config, col: int, row: int) -> bool:
-    """Check if a pipe occupies a specific position."""
-    # Check horizontal bounds
-    if col < pipe.x or col >= pipe.x + config.pipe_width:
-        return False
+    The grid is a single bytearray (one byte per cell) and each pipe is filled
+    as two column spans (above and below its gap), so drawing is slice copies
+    rather than per-cell work. It is decoded to text once at the end.
+    """
+    width = config.screen_width
+    height = config.screen_height
+    pipe_width = config.pipe_width
+    grid = bytearray(b" ") * (width * height)
 
-    # Check if in gap
-    gap_top = int(pipe.gap_y - pipe.gap_size / 2)
-    gap_bottom = int(pipe.gap_y + pipe.gap_size / 2)
+    for pipe in state.pipes:
+        pipe_x = pipe.x
+        x0 = max(0, pipe_x)
+        x1 = min(width, pipe_x + pipe_width)
+        if x0 >= x1:
+            continue
 
-    if gap_top <= row <= gap_bottom:
-        return False
+        span = _pipe_span(x1 - x0)
+        for row in range(min(pipe.gap_top, height)):
+            offset = row * width
+            grid[offset + x0:offset + x1] = span
+        for row in range(max(0, pipe.gap_bottom + 1), height):
+            offset = row * width
+            grid[offset + x0:offset + x1] = span
 
-    return True
+    text = grid.decode("latin-1").translate(_GRID_GLYPHS)
+    return [text[offset:offset + width] for offset in range(0, width * height, width)]
 
 
 def get_difficulty_params(score: int, config: Config) -> tuple[int, int]:
@@ -277,7 +336,7 @@ def spawn_pipe(state: GameState, config: Config) -> None:
     if max_gap_y <= min_gap_y:
         gap_y = config.screen_height // 2
     else:
-        gap_y = random.randint(min_gap_y, max_gap_y)
+        gap_y = _randrange(min_gap_y, max_gap_y + 1)
 
     pipe = Pipe(
         x=config.screen_width,
@@ -292,36 +351,45 @@ def update_game(state: GameState, config: Config) -> None:
     if state.status != GameStatus.PLAYING:
         return
 
-    # Update bird
-    updated_bird = apply_gravity(state.bird, config)
-    state.bird.y = updated_bird.y
-    state.bird.velocity = updated_bird.velocity
+    bird = state.bird
+    pipes = state.pipes
+    pipe_width = config.pipe_width
+
+    # Update bird in place (same gravity step as physics.apply_gravity, no copy)
+    bird.update(config)
 
     # Update pipes
-    for pipe in state.pipes:
+    for pipe in pipes:
         pipe.update(config)
 
-    # Remove off-screen pipes
-    state.pipes = [p for p in state.pipes if p.x > -config.pipe_width]
+    # Remove off-screen pipes (only the leftmost, already passed, ones can leave)
+    while pipes and pipes[0].x <= -pipe_width:
+        pipes.popleft()
+        state.next_pipe = max(0, state.next_pipe - 1)
 
     # Spawn new pipes (spacing decreases with difficulty)
     _, current_spacing = get_difficulty_params(state.score, config)
-    if not state.pipes or state.pipes[-1].x < config.screen_width - current_spacing:
+    if not pipes or pipes[-1].x < config.screen_width - current_spacing:
         spawn_pipe(state, config)
 
-    # Check scoring
-    for pipe in state.pipes:
-        if not pipe.passed and check_pipe_passed(state.bird, pipe):
-            pipe.mark_passed()
-            state.score += 1
-            if state.score > state.high_score:
-                state.high_score = state.score
-                # Save new high score immediately
-                high_score_path = Path(config.high_score_path).expanduser()
-                save_high_score(high_score_path, state.high_score)
-
-    # Check collision
-    if check_collision(state.bird, state.pipes, config.screen_height):
+    # Check scoring. Pipes are ordered left to right, so only the pipes from
+    # next_pipe onward can be newly passed and we can stop at the first miss.
+    next_pipe = state.next_pipe
+    while next_pipe < len(pipes) and check_pipe_passed(bird, pipes[next_pipe]):
+        pipes[next_pipe].mark_passed()
+        next_pipe += 1
+        state.score += 1
+        if state.score > state.high_score:
+            state.high_score = state.score
+            # Save new high score immediately
+            high_score_path = Path(config.high_score_path).expanduser()
+            save_high_score(high_score_path, state.high_score)
+    state.next_pipe = next_pipe
+
+    # Check collision. Only the most recently passed pipe (which may still
+    # overlap the bird's column) and the next one can touch the bird.
+    nearby_pipes = itertools.islice(pipes, max(0, next_pipe - 1), next_pipe + 1)
+    if check_collision(bird, nearby_pipes, config.screen_height):
         state.status = GameStatus.DEAD
 
 
@@ -336,7 +404,7 @@ def handle_input(state: GameState, config: Config, key: int) -> None:
     if key == -1:
         return
 
-    if key in (ord('q'), ord('Q'), 27):  # q, Q, or ESC
+    if key in _QUIT_KEYS:
         state.status = GameStatus.EXITING
     elif key == ord(' ') and state.status == GameStatus.WAITING:
         state.status = GameStatus.PLAYING
@@ -352,8 +420,45 @@ def handle_input(state: GameState, config: Config, key: int) -> None:
         state.status = GameStatus.EXITING
 
 
-def init_colors() -> None:
-    """Initialize curses color pairs."""
+def read_key(stdscr: curses.window) -> tuple[int, bool]:
+    """Drain all pending input and return the key to act on this frame.
+
+    A quit key wins over anything else typed in the same burst, then a Y/N
+    answer (so a trailing flap can't swallow "return to Claude"); otherwise
+    the most recent key is returned so mashed keys don't spill into later
+    frames. A terminal resize is reported separately so it isn't lost
+    behind a key queued after it.
+
+    Args:
+        stdscr: curses window in nodelay mode
+
+    Returns:
+        tuple of (key code or -1 if no key was pending, whether the terminal was resized)
+    """
+    key = -1
+    answer = -1
+    resized = False
+    while True:
+        pending = stdscr.getch()
+        if pending == -1:
+            return (answer if answer != -1 else key), resized
+        if pending == curses.KEY_RESIZE:
+            resized = True
+        elif pending in _QUIT_KEYS:
+            return pending, resized
+        elif pending in _ANSWER_KEYS:
+            answer = pending
+        else:
+            key = pending
+
+
+def init_colors() -> dict[str, int]:
+    """Initialize curses color pairs.
+
+    Returns:
+        Text attributes built from the color pairs, keyed by what they style,
+        for passing to the render functions
+    """
     curses.start_color()
     curses.use_default_colors()
 
@@ -365,8 +470,32 @@ def init_colors() -> None:
     curses.init_pair(5, curses.COLOR_WHITE, -1)     # Footer
     curses.init_pair(6, curses.COLOR_CYAN, -1)      # Overlay
 
+    return dict(
+        border=curses.color_pair(1),
+        header=curses.color_pair(2) | curses.A_BOLD,
+        header_waiting=curses.color_pair(3) | curses.A_BOLD | curses.A_BLINK,
+        bird=curses.color_pair(3) | curses.A_BOLD,
+        pipe=curses.color_pair(4),
+        footer=curses.color_pair(5),
+        overlay=curses.color_pair(6) | curses.A_BOLD,
+        overlay_text=curses.color_pair(2),
+    )
+
 
-def game_main(stdscr, state: GameState, config: Config, signal_file: Path | None) -> None:
+def _frame_key(state: GameState) -> tuple[object, ...]:
+    """Fingerprint everything render_game draws, to skip redrawing identical frames."""
+    return (
+        int(state.bird.y),
+        state.bird.x,
+        state.score,
+        state.high_score,
+        state.status,
+        state.claude_ready,
+        tuple((pipe.x, pipe.gap_y, pipe.gap_size) for pipe in state.pipes),
+    )
+
+
+def game_main(stdscr: curses.window, state: GameState, config: Config, signal_file: Path | None) -> None:
     """Main game loop running inside curses wrapper.
 
     Args:
@@ -378,61 +507,106 @@ def game_main(stdscr, state: GameState, config: Config, signal_file: Path | None
     # Setup curses
     curses.curs_set(0)  # Hide cursor
     stdscr.nodelay(True)  # Non-blocking input
-    stdscr.timeout(1000 // config.fps)  # Input timeout for frame rate
-    init_colors()
+    attrs = init_colors()  # Resolved once instead of on every draw call
+
+    # Get notified when the signal file is written, falling back to polling it
+    selector = selectors.DefaultSelector()
+    watch_fd = watch_signal_file(signal_file) if signal_file else None
+    if watch_fd is not None:
+        selector.register(watch_fd, selectors.EVENT_READ)
 
     frame_time = 1.0 / config.fps
+    last_frame: tuple[object, ...] | None = None
+    signal_path = str(signal_file) if signal_file else None
+    signal_pending = True  # Check once up front in case Claude already finished
+    frame_count = 0
+    next_frame = time.perf_counter() + frame_time
+    ticks = 1
 
     try:
         while state.status != GameStatus.EXITING:
-            start = time.time()
-
-            # Handle input
-            key = stdscr.getch()
+            frame_count += 1
+
+            # Handle input. Non-blocking getch() every frame: curses reports
+            # KEY_RESIZE from inside it, so it can't wait behind a stdin check.
+            key, resized = read_key(stdscr)
+            if resized:
+                stdscr.clear()  # Force a full repaint at the new size
+                last_frame = None
             handle_input(state, config, key)
 
             # Check signal file for Claude ready (when waiting or playing)
-            if signal_file and state.status in (GameStatus.WAITING, GameStatus.PLAYING):
-                if not state.claude_ready and check_signal_file(signal_file):
+            if watch_fd is not None and signal_file and selector.select(0):
+                if signal_file_changed(watch_fd, signal_file):
+                    signal_pending = True
+            elif watch_fd is None and frame_count % config.signal_poll_frames == 0:
+                signal_pending = True
+            if signal_path and signal_pending and state.status in (GameStatus.WAITING, GameStatus.PLAYING):
+                signal_pending = False
+                if not state.claude_ready and check_signal_file(signal_path):
                     state.claude_ready = True
                     state.was_playing = (state.status == GameStatus.PLAYING)
                     state.prompted_at = time.time()
                     state.status = GameStatus.PROMPTED
 
-            # Update game
-            update_game(state, config)
+            # Update game (several ticks if the last frame ran long, so the
+            # simulation keeps pace and only the latest state gets drawn)
+            for _ in range(ticks):
+                update_game(state, config)
 
-            # Render based on state
+            # Render based on state, skipping frames identical to the last one
+            frame = _frame_key(state)
             if state.status == GameStatus.WAITING:
-                render_waiting_screen(stdscr, state, config)
+                if frame != last_frame:
+                    render_waiting_screen(stdscr, state, config, attrs)
             elif state.status == GameStatus.PROMPTED:
                 # Calculate countdown (10 seconds)
                 elapsed = time.time() - state.prompted_at
                 countdown = max(0, 10 - int(elapsed))
+                frame += (countdown,)
                 if countdown <= 0:
                     state.status = GameStatus.EXITING
-                else:
-                    render_claude_ready_prompt(stdscr, state, config, countdown)
+                elif frame != last_frame:
+                    render_claude_ready_prompt(stdscr, state, config, attrs, countdown)
             elif state.status == GameStatus.DEAD:
                 if state.mode == GameMode.SINGLE_LIFE:
-                    render_game_over_screen(stdscr, state, config)
-                    # Wait for any key
+                    render_game_over_screen(stdscr, state, config, attrs)
+                    curses.doupdate()
+                    # Block until a fresh key; flaps typed while dying don't count
+                    curses.flushinp()
                     stdscr.nodelay(False)
                     stdscr.getch()
                     state.status = GameStatus.EXITING
                 else:
-                    render_death_screen(stdscr, state, config)
+                    render_death_screen(stdscr, state, config, attrs)
+                    curses.doupdate()
                     time.sleep(config.death_display_time)
                     state.reset(config)
+                    signal_pending = True  # reset() clears claude_ready
+            elif frame != last_frame:
+                render_game(stdscr, state, config, attrs)
+            last_frame = frame
+
+            # Write the frame (game plus any overlay) to the terminal in one update
+            curses.doupdate()
+
+            # Frame timing against absolute deadlines so late wakeups don't accumulate
+            now = time.perf_counter()
+            if now < next_frame:
+                time.sleep(next_frame - now)
+                ticks = 1
             else:
-                render_game(stdscr, state, config)
-
-            # Frame timing
-            elapsed = time.time() - start
-            if elapsed < frame_time:
-                time.sleep(frame_time - elapsed)
+                ticks = 1 + int((now - next_frame) / frame_time)
+                if ticks > _MAX_CATCHUP_TICKS:
+                    next_frame = now  # Fell far behind (e.g. death screen), resync instead
+                    ticks = 1
+            next_frame += ticks * frame_time
 
     finally:
+        selector.close()
+        if watch_fd is not None:
+            os.close(watch_fd)
+
         # Clean up signal file
         if signal_file:
             delete_signal_file(signal_file)
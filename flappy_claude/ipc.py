@@ -1,11 +1,26 @@
 """Inter-process communication via signal files."""
 
+import ctypes
+import os
+import struct
+import sys
 from pathlib import Path
 
+# inotify(7) event masks and the fixed part of struct inotify_event
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_INOTIFY_EVENT = struct.Struct("iIII")
 
-def check_signal_file(path: Path) -> bool:
+
+def check_signal_file(path: str | Path) -> bool:
     """Check if the signal file indicates Claude is ready.
 
+    Uses a single open/read so the per-frame poll costs one syscall round
+    trip when the file is missing. Callers polling in a loop should pass a
+    str to skip path conversion on every call.
+
     Args:
         path: Path to the signal file
 
@@ -13,13 +28,83 @@ def check_signal_file(path: Path) -> bool:
         True if signal file contains "ready", False otherwise
     """
     try:
-        if not path.exists():
-            return False
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
 
-        content = path.read_text().strip()
-        return content == "ready"
-    except (OSError, IOError):
+    try:
+        content = os.read(fd, 16)
+    except OSError:
         return False
+    finally:
+        os.close(fd)
+
+    return content.strip() == b"ready"
+
+
+def watch_signal_file(path: Path) -> int | None:
+    """Start watching the signal file's directory for new or rewritten files.
+
+    Lets the game wait for the "ready" signal without polling. Only Linux
+    (inotify) is supported; elsewhere callers should fall back to polling
+    check_signal_file.
+
+    Args:
+        path: Path to the signal file
+
+    Returns:
+        A non-blocking file descriptor that becomes readable when a file in
+        the directory is created or written, or None if watching isn't available
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+
+    fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+
+    mask = _IN_CREATE | _IN_CLOSE_WRITE | _IN_MOVED_TO
+    if libc.inotify_add_watch(fd, os.fsencode(path.parent), mask) < 0:
+        os.close(fd)
+        return None
+
+    return fd
+
+
+def signal_file_changed(fd: int, path: Path) -> bool:
+    """Drain pending watch events and report whether any touched the signal file.
+
+    Args:
+        fd: Descriptor returned by watch_signal_file
+        path: Path to the signal file
+
+    Returns:
+        True if the signal file was created or written since the last call,
+        or if the event queue overflowed and a write may have been dropped
+    """
+    name = os.fsencode(path.name)
+    changed = False
+    while True:
+        try:
+            data = os.read(fd, 4096)
+        except OSError:
+            return changed  # Drained (EAGAIN) or watch gone
+
+        offset = 0
+        while offset + _INOTIFY_EVENT.size <= len(data):
+            _, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            start = offset + _INOTIFY_EVENT.size
+            # An overflow means events were dropped, so assume the write was one
+            if mask & _IN_Q_OVERFLOW or data[start:start + length].rstrip(b"\0") == name:
+                changed = True
+            offset = start + length
 
 
 def delete_signal_file(path: Path) -> None:
@@ -1,5 +1,7 @@
 """Physics functions: gravity, collision detection, scoring."""
 
+from collections.abc import Iterable
+
 from flappy_claude.config import Config
 from flappy_claude.entities import Bird, Pipe
 
@@ -16,12 +18,12 @@ def apply_gravity(bird: Bird, config: Config) -> Bird:
     return Bird(y=new_y, velocity=new_velocity, x=bird.x)
 
 
-def check_collision(bird: Bird, pipes: list[Pipe], screen_height: int) -> bool:
+def check_collision(bird: Bird, pipes: Iterable[Pipe], screen_height: int) -> bool:
     """Check if bird collides with boundaries or pipes.
 
     Args:
         bird: The bird to check
-        pipes: List of pipes to check against
+        pipes: Pipes to check against
         screen_height: Height of the game screen
 
     Returns:
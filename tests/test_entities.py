@@ -106,6 +106,26 @@ class TestPipeUpdate:
         assert pipe.gap_size == original_gap_size
 
 
+class TestPipeGapBounds:
+    """Tests for the precomputed Pipe gap rows."""
+
+    def test_gap_bounds_surround_gap_y(self) -> None:
+        """gap_top and gap_bottom are gap_y -/+ half the gap, truncated."""
+        pipe = Pipe(x=50, gap_y=10, gap_size=7)
+
+        assert pipe.gap_top == 6
+        assert pipe.gap_bottom == 13
+
+    def test_gap_bounds_unchanged_by_update(self) -> None:
+        """Moving the pipe doesn't change its gap rows."""
+        pipe = Pipe(x=50, gap_y=10, gap_size=8)
+
+        pipe.update(DEFAULT_CONFIG)
+
+        assert pipe.gap_top == 6
+        assert pipe.gap_bottom == 14
+
+
 class TestPipeMarkPassed:
     """Tests for Pipe.mark_passed() method."""
 
@@ -185,3 +205,12 @@ class TestGameStateReset:
         state.reset(DEFAULT_CONFIG)
 
         assert state.mode == GameMode.SINGLE_LIFE
+
+    def test_reset_clears_next_pipe(self) -> None:
+        """GameState.reset() starts scoring from the first pipe again."""
+        state = GameState.new_game(DEFAULT_CONFIG)
+        state.next_pipe = 3
+
+        state.reset(DEFAULT_CONFIG)
+
+        assert state.next_pipe == 0
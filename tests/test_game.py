@@ -0,0 +1,147 @@
+"""Tests for the game module - input, scoring and collision."""
+
+import curses
+from pathlib import Path
+
+import pytest
+
+from flappy_claude.config import Config
+from flappy_claude.entities import GameState, GameStatus, Pipe
+from flappy_claude.game import read_key, update_game
+
+
+class StubWindow:
+    """Stands in for a nodelay curses window, returning queued key codes."""
+
+    def __init__(self, keys: list[int]) -> None:
+        self.keys = keys
+
+    def getch(self) -> int:
+        """Pop the next queued key, or -1 once the queue is empty."""
+        return self.keys.pop(0) if self.keys else -1
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> Config:
+    """Default configuration with the high score file kept out of $HOME."""
+    return Config(high_score_path=str(tmp_path / "highscore"))
+
+
+@pytest.fixture
+def state(config: Config) -> GameState:
+    """Game in progress with the bird hovering mid-screen."""
+    state = GameState.new_game(config)
+    state.status = GameStatus.PLAYING
+    state.bird.y = 10.0
+    state.bird.velocity = -config.gravity  # Gravity cancels out this frame
+    return state
+
+
+class TestUpdateGameScoring:
+    """Tests for scoring in update_game."""
+
+    def test_scores_when_pipe_passes_bird(self, config: Config, state: GameState) -> None:
+        """Bird scores once the pipe moves behind it."""
+        state.pipes.append(Pipe(x=state.bird.x, gap_y=10, gap_size=8))
+
+        update_game(state, config)
+
+        assert state.score == 1
+        assert state.pipes[0].passed is True
+        assert state.next_pipe == 1
+
+    def test_does_not_score_pipe_ahead(self, config: Config, state: GameState) -> None:
+        """Pipes still ahead of the bird don't score."""
+        state.pipes.append(Pipe(x=state.bird.x + 10, gap_y=10, gap_size=8))
+
+        update_game(state, config)
+
+        assert state.score == 0
+        assert state.next_pipe == 0
+
+    def test_scores_each_pipe_once(self, config: Config, state: GameState) -> None:
+        """A passed pipe is not scored again on later frames."""
+        state.pipes.append(Pipe(x=state.bird.x, gap_y=10, gap_size=8))
+
+        update_game(state, config)
+        state.bird.velocity = -config.gravity
+        update_game(state, config)
+
+        assert state.score == 1
+
+    def test_next_pipe_follows_removed_pipes(self, config: Config, state: GameState) -> None:
+        """Removing off-screen pipes keeps next_pipe pointing at the same pipe."""
+        gone = Pipe(x=-config.pipe_width + 1, gap_y=10, gap_size=8, passed=True)
+        ahead = Pipe(x=state.bird.x + 10, gap_y=10, gap_size=8)
+        state.pipes.extend([gone, ahead])
+        state.next_pipe = 1
+
+        update_game(state, config)
+
+        assert state.pipes[0] is ahead
+        assert state.next_pipe == 0
+
+
+class TestUpdateGameCollision:
+    """Tests for collision in update_game."""
+
+    def test_dies_hitting_pipe(self, config: Config, state: GameState) -> None:
+        """Bird dies when it flies into a pipe outside the gap."""
+        state.pipes.append(Pipe(x=state.bird.x + 1, gap_y=3, gap_size=4))
+
+        update_game(state, config)
+
+        assert state.status == GameStatus.DEAD
+
+    def test_dies_hitting_just_passed_pipe(self, config: Config, state: GameState) -> None:
+        """A pipe already scored still kills the bird while overlapping it."""
+        state.pipes.append(Pipe(x=state.bird.x - 1, gap_y=3, gap_size=4, passed=True))
+        state.next_pipe = 1
+
+        update_game(state, config)
+
+        assert state.status == GameStatus.DEAD
+
+    def test_survives_through_gap(self, config: Config, state: GameState) -> None:
+        """Bird flying through the gap stays alive."""
+        state.pipes.append(Pipe(x=state.bird.x + 1, gap_y=10, gap_size=8))
+
+        update_game(state, config)
+
+        assert state.status == GameStatus.PLAYING
+
+
+class TestReadKey:
+    """Tests for read_key input draining."""
+
+    def test_no_input(self) -> None:
+        """Returns -1 and no resize when nothing is pending."""
+        assert read_key(StubWindow([])) == (-1, False)
+
+    def test_returns_most_recent_key(self) -> None:
+        """The last key of a burst is the one acted on."""
+        assert read_key(StubWindow([ord('x'), ord(' ')])) == (ord(' '), False)
+
+    def test_quit_key_wins(self) -> None:
+        """A quit key in the burst wins over later keys."""
+        assert read_key(StubWindow([ord(' '), ord('q'), ord(' ')])) == (ord('q'), False)
+
+    def test_quit_key_wins_over_answer(self) -> None:
+        """A quit key wins even over a Y/N answer."""
+        assert read_key(StubWindow([ord('y'), ord('q')])) == (ord('q'), False)
+
+    def test_answer_wins_over_trailing_flap(self) -> None:
+        """Y followed by a space still returns to Claude."""
+        assert read_key(StubWindow([ord('y'), ord(' ')])) == (ord('y'), False)
+
+    def test_decline_wins_over_trailing_flap(self) -> None:
+        """N followed by a space at the prompt still keeps playing."""
+        assert read_key(StubWindow([ord('N'), ord(' '), ord(' ')])) == (ord('N'), False)
+
+    def test_resize_reported_alongside_key(self) -> None:
+        """A resize queued ahead of a key is still reported."""
+        assert read_key(StubWindow([curses.KEY_RESIZE, ord(' ')])) == (ord(' '), True)
+
+    def test_resize_alone(self) -> None:
+        """A resize with no key pending is reported without a key."""
+        assert read_key(StubWindow([curses.KEY_RESIZE])) == (-1, True)
@@ -0,0 +1,116 @@
+"""Tests for signal file IPC."""
+
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+from flappy_claude.ipc import (
+    check_signal_file,
+    delete_signal_file,
+    signal_file_changed,
+    watch_signal_file,
+)
+
+
+class TestCheckSignalFile:
+    """Tests for check_signal_file function."""
+
+    def test_returns_false_when_file_missing(self, tmp_path: Path) -> None:
+        """check_signal_file returns False when file doesn't exist."""
+        signal_file = tmp_path / "signal"
+
+        assert check_signal_file(signal_file) is False
+
+    def test_returns_false_for_empty_file(self, tmp_path: Path) -> None:
+        """check_signal_file returns False for an empty (game running) file."""
+        signal_file = tmp_path / "signal"
+        signal_file.touch()
+
+        assert check_signal_file(signal_file) is False
+
+    def test_returns_true_when_ready(self, tmp_path: Path) -> None:
+        """check_signal_file returns True when file contains "ready"."""
+        signal_file = tmp_path / "signal"
+        signal_file.write_text("ready\n")
+
+        assert check_signal_file(signal_file) is True
+
+    def test_accepts_string_path(self, tmp_path: Path) -> None:
+        """check_signal_file accepts a plain string path."""
+        signal_file = tmp_path / "signal"
+        signal_file.write_text("ready")
+
+        assert check_signal_file(str(signal_file)) is True
+
+    def test_returns_false_for_other_content(self, tmp_path: Path) -> None:
+        """check_signal_file returns False for anything other than "ready"."""
+        signal_file = tmp_path / "signal"
+        signal_file.write_text("not ready")
+
+        assert check_signal_file(signal_file) is False
+
+
+class TestDeleteSignalFile:
+    """Tests for delete_signal_file function."""
+
+    def test_removes_existing_file(self, tmp_path: Path) -> None:
+        """delete_signal_file removes the signal file."""
+        signal_file = tmp_path / "signal"
+        signal_file.write_text("ready")
+
+        delete_signal_file(signal_file)
+
+        assert not signal_file.exists()
+
+    def test_ignores_missing_file(self, tmp_path: Path) -> None:
+        """delete_signal_file does nothing when file doesn't exist."""
+        delete_signal_file(tmp_path / "signal")  # Should not raise
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+class TestWatchSignalFile:
+    """Tests for watch_signal_file and signal_file_changed."""
+
+    def test_reports_write_to_signal_file(self, tmp_path: Path) -> None:
+        """Writing the signal file is reported once."""
+        signal_file = tmp_path / "signal"
+        fd = watch_signal_file(signal_file)
+        assert fd is not None
+
+        try:
+            signal_file.write_text("ready")
+
+            assert signal_file_changed(fd, signal_file) is True
+            assert signal_file_changed(fd, signal_file) is False
+        finally:
+            os.close(fd)
+
+    def test_ignores_other_files(self, tmp_path: Path) -> None:
+        """Writes to other files in the directory aren't reported."""
+        signal_file = tmp_path / "signal"
+        fd = watch_signal_file(signal_file)
+        assert fd is not None
+
+        try:
+            (tmp_path / "other").write_text("ready")
+
+            assert signal_file_changed(fd, signal_file) is False
+        finally:
+            os.close(fd)
+
+    def test_reports_queue_overflow(self, tmp_path: Path) -> None:
+        """A queue overflow is reported since the signal write may be lost."""
+        signal_file = tmp_path / "signal"
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+
+        try:
+            os.write(w, struct.pack("iIII", -1, 0x4000, 0, 0))
+
+            assert signal_file_changed(r, signal_file) is True
+        finally:
+            os.close(r)
+            os.close(w)